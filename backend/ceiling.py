@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
-from typing import Callable, Any, Optional, List, Tuple
+from collections import OrderedDict
+from typing import Callable, Any, Optional, List, Sequence, Tuple
 from typing_extensions import Self
+from microcontroller import Pin
 from backend.cartesian_indexing import CartesianIndexing
 from backend.float_cartesian import FloatCartesianIndexing
 from backend.float_polar import FloatPolarIndexing
-from backend.led_locations import LEDSpace
 from backend.linear_indexing import LinearIndexing
 from backend.neopixel_wrapper import (
     init_for_testing,
@@ -25,11 +26,21 @@ A layer between the neopixel API and our light scripts to abstract away all that
 
 # Basement related constants
 NUMBER_LIGHTS = 200
+# How many recently used indexing objects a `Ceiling` holds on to
+INDEXING_CACHE_SIZE = 8
 CEILING_ROW_ARRANGEMENT = [29, 29, 32, 29, 32, 28, 20]
 
 
 class Ceiling:
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        test_mode: bool = False,
+        number_lights: int = NUMBER_LIGHTS,
+        print_to_stdout: bool = True,
+        io_pin: Optional[Pin] = None,
+        auto_write: bool = False,
+        **_ignored,
+    ):
         """
         If using actual light strip:
         `io_pin`: which GPIO pin neopixels should be initialized for
@@ -41,48 +52,23 @@ class Ceiling:
         `test_mode`: to true
         `number_lights`: number lights in the light strip
         `print_to_stdout`: whether to print to stdout. Default true
-        """
-        # Initialize for testing mode
-        # For running not on a Pi
-        if kwargs.get("test_mode"):
-            opt_number_lights = kwargs.get("number_lights")
-            if opt_number_lights and type(opt_number_lights) is int:
-                number_lights = opt_number_lights
-            else:
-                number_lights = NUMBER_LIGHTS
-
-            opt_print_to_stdout = kwargs.get("print_to_stdout")
-            if type(opt_print_to_stdout) is bool:
-                print_to_stdout = opt_print_to_stdout
-            else:
-                print_to_stdout = True
 
+        Any other keyword arguments are ignored
+        """
+        if test_mode:  # For running not on a Pi
             self._pixels = init_for_testing(
                 number_leds=number_lights, print_to_stdout=print_to_stdout
             )
             self.testing_mode_rows()
         else:  # For running on the actual pi
-            io_pin = kwargs.get("io_pin")
-
-            opt_number_lights = kwargs.get("number_lights")
-            if opt_number_lights and type(opt_number_lights) is int:
-                number_lights = opt_number_lights
-            else:
-                number_lights = NUMBER_LIGHTS
-
-            opt_auto_write = kwargs.get("auto_write")
-            if opt_auto_write and type(opt_auto_write) is bool:
-                auto_write = opt_auto_write
-            else:
-                auto_write = False
-
             self._pixels = init_with_real_board(
                 io_pin, number_lights, auto_write=auto_write
             )
 
-        self._indexing = LinearIndexing(self._pixels)
+        # Recently used indexing objects, keyed on the indexing used and its arguments
+        self._indexing_cache: OrderedDict[Tuple, Indexing] = OrderedDict()
+        self.use_linear()
         self.NUMBER_LIGHTS = NUMBER_LIGHTS
-        self._cached_led_spacing: Optional[LEDSpace] = None
 
     # ===== Animation / Clearing ==========
 
@@ -107,6 +93,12 @@ class Ceiling:
     def __setitem__(self, key: Any, value: RGB) -> None:
         self._indexing.set(key, value)
 
+    def set_range(self, start: int, colors: Sequence[RGB]) -> None:
+        """Set consecutive pixels in the light strip starting at `start` to `colors` in one write.
+        Always uses the light strip's linear order (regardless of indexing), wrapping around past
+        the end"""
+        self._pixels.set_range(start, colors)
+
     def rows(self) -> Optional[List[int]]:
         """Returns rows information if the indexing is row indexing"""
         if isinstance(self._indexing, RowIndexing):
@@ -128,15 +120,30 @@ class Ceiling:
         Prepares the ceiling object to be sent between processes with `Pipe`
         Must call this before sending this with `pipe.send(ceiling)`!
         """
-        self._cached_led_spacing = None
+        self._indexing_cache.clear()
         self._pixels.prepare_to_send()
         self._indexing.prepare_to_send()
 
     # ===== Indexing ==========
 
+    def _use_cached_indexing(
+        self, key: Tuple, make_indexing: Callable[[], Indexing]
+    ) -> None:
+        """Switch to the indexing stored under `key`, only creating it with `make_indexing` if it
+        is not one of the `INDEXING_CACHE_SIZE` most recently used"""
+        indexing = self._indexing_cache.get(key)
+        if indexing is None:
+            indexing = make_indexing()
+            self._indexing_cache[key] = indexing
+            if len(self._indexing_cache) > INDEXING_CACHE_SIZE:
+                self._indexing_cache.popitem(last=False)
+        else:
+            self._indexing_cache.move_to_end(key)
+        self._indexing = indexing
+
     def use_linear(self):
         "Use linear indexing"
-        self._indexing = LinearIndexing(self._pixels)
+        self._use_cached_indexing(("linear",), lambda: LinearIndexing(self._pixels))
 
     def with_linear(self, block: Callable[[Self], None]) -> None:
         """Execute `block` with the linear indexing method"""
@@ -147,7 +154,10 @@ class Ceiling:
 
     def use_row(self, lights_per_row: List[int] = CEILING_ROW_ARRANGEMENT):
         """Use row based indexing"""
-        self._indexing = RowIndexing(self._pixels, lights_per_row)
+        self._use_cached_indexing(
+            ("row", tuple(lights_per_row)),
+            lambda: RowIndexing(self._pixels, lights_per_row),
+        )
 
     def with_row(self, block: Callable[[Self], None]) -> None:
         """Execute `block` with the row indexing method"""
@@ -162,13 +172,14 @@ class Ceiling:
         search_range: float = 0.2,
     ):
         """Use cartesian indexing"""
-        self._indexing = CartesianIndexing(
-            self._pixels,
-            lights_per_row,
-            search_range,
-            cached_led_spacing=self._cached_led_spacing,
+        self._use_cached_indexing(
+            ("cartesian", tuple(lights_per_row), search_range),
+            lambda: CartesianIndexing(
+                self._pixels,
+                lights_per_row,
+                search_range,
+            ),
         )
-        self._cached_led_spacing = self._indexing._led_spacing
 
     def with_cartesian(
         self,
@@ -190,14 +201,15 @@ class Ceiling:
     ):
         assert len(origin) == 2
         """Use polar indexing"""
-        self._indexing = PolarIndexing(
-            self._pixels,
-            lights_per_row=lights_per_row,
-            origin=origin,
-            search_range=search_range,
-            cached_led_spacing=self._cached_led_spacing,
+        self._use_cached_indexing(
+            ("polar", tuple(origin), tuple(lights_per_row), search_range),
+            lambda: PolarIndexing(
+                self._pixels,
+                lights_per_row=lights_per_row,
+                origin=origin,
+                search_range=search_range,
+            ),
         )
-        self._cached_led_spacing = self._indexing._led_spacing
 
     def with_polar(
         self,
@@ -218,13 +230,14 @@ class Ceiling:
         effect_radius: float = 0.2,
     ):
         """Use floating point cartesian indexing"""
-        self._indexing = FloatCartesianIndexing(
-            self._pixels,
-            lights_per_row,
-            effect_radius=effect_radius,
-            cached_led_spacing=self._cached_led_spacing,
+        self._use_cached_indexing(
+            ("float_cartesian", tuple(lights_per_row), effect_radius),
+            lambda: FloatCartesianIndexing(
+                self._pixels,
+                lights_per_row,
+                effect_radius=effect_radius,
+            ),
         )
-        self._cached_led_spacing = self._indexing._led_spacing
 
     def with_float_cartesian(
         self,
@@ -245,14 +258,15 @@ class Ceiling:
         effect_radius: float = 0.2,
     ):
         """Use floating point polar indexing"""
-        self._indexing = FloatPolarIndexing(
-            self._pixels,
-            lights_per_row,
-            origin,
-            effect_radius=effect_radius,
-            cached_led_spacing=self._cached_led_spacing,
+        self._use_cached_indexing(
+            ("float_polar", tuple(origin), tuple(lights_per_row), effect_radius),
+            lambda: FloatPolarIndexing(
+                self._pixels,
+                lights_per_row,
+                origin,
+                effect_radius=effect_radius,
+            ),
         )
-        self._cached_led_spacing = self._indexing._led_spacing
 
     def with_float_polar(
         self,
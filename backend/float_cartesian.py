@@ -5,10 +5,9 @@ from backend.indexing import Indexing
 
 from backend.neopixel_wrapper import PixelWrapper
 from backend.backend_types import RGB
-from backend.led_locations import LEDSpace
+from backend.led_locations import build_led_space
 from backend.util import (
     color_leds_in_area,
-    fast_round,
 )
 
 
@@ -21,7 +20,6 @@ class FloatCartesianIndexing(Indexing):
         pixels: PixelWrapper,
         lights_per_row: List[int],
         effect_radius: float = 0.2,
-        cached_led_spacing: Optional[LEDSpace] = None,
     ):
         """
         `effect_range`: radius around point that will be affected
@@ -30,12 +28,7 @@ class FloatCartesianIndexing(Indexing):
         self._lights_per_row = lights_per_row
         self._effect_radius = effect_radius
 
-        if cached_led_spacing:
-            self._led_spacing = cached_led_spacing
-            self._led_spacing.clear_caches()
-        else:
-            self._led_spacing = LEDSpace()
-            self._led_spacing.map_LEDs_in_zigzag(lights_per_row)
+        self._led_spacing = build_led_space(tuple(lights_per_row))
 
     def get(self, key: Tuple[float, float]) -> Optional[RGB]:
         """key: (x, y), x and y in (0..1)
@@ -43,10 +36,6 @@ class FloatCartesianIndexing(Indexing):
         """
         x, y = key
 
-        # Round to improve caching ability of led spacing
-        x = fast_round(x, 3)
-        y = fast_round(y, 3)
-
         indx = self._led_spacing.get_closest_LED_index(x, y, self._effect_radius)
         return None if indx is None else self._pixels[indx]
 
@@ -68,26 +57,16 @@ class FloatCartesianIndexing(Indexing):
             x = min(x1, x2) + (horiz_dist / 2)
             y = min(y1, y2) + (vert_dist / 2)
 
-            # Round to improve caching ability of led spacing
-            x = fast_round(x, 3)
-            y = fast_round(y, 3)
-            horiz_dist = fast_round(horiz_dist, 3)
-            vert_dist = fast_round(vert_dist, 3)
-
             leds = self._led_spacing.get_LEDs_in_area(x, y, horiz_dist, vert_dist)
-            for l in leds:
-                self._pixels[l._index] = newvalue
+            for i in leds.tolist():
+                self._pixels[i] = newvalue
 
         else:
             x, y = key
 
-            # Round to improve caching ability of led spacing
-            x = fast_round(x, 3)
-            y = fast_round(y, 3)
-
             color_leds_in_area(
                 x, y, self._effect_radius, newvalue, self._led_spacing, self._pixels
             )
 
     def prepare_to_send(self):
-        self._led_spacing.save_quadtree_values_in_list()
+        pass
@@ -5,10 +5,9 @@ from backend.indexing import Indexing
 
 from backend.neopixel_wrapper import PixelWrapper
 from backend.backend_types import RGB
-from backend.led_locations import LEDSpace
+from backend.led_locations import build_led_space
 from backend.util import (
     color_leds_in_area,
-    fast_round,
     polar_to_cartesian,
     transform_unit_circle_to_origin,
 )
@@ -26,19 +25,13 @@ class FloatPolarIndexing(Indexing):
         lights_per_row: List[int],
         origin: Tuple[float, float] = (0.5, 0.5),
         effect_radius: float = 0.2,
-        cached_led_spacing: Optional[LEDSpace] = None,
     ):
         self._pixels = pixels
         self._origin = origin
         self._lights_per_row = lights_per_row
         self._effect_radius = effect_radius
 
-        if cached_led_spacing:
-            self._led_spacing = cached_led_spacing
-            self._led_spacing.clear_caches()
-        else:
-            self._led_spacing = LEDSpace()
-            self._led_spacing.map_LEDs_in_zigzag(lights_per_row)
+        self._led_spacing = build_led_space(tuple(lights_per_row))
 
     def get(self, key: Tuple[float, float]) -> Optional[RGB]:
         """
@@ -48,9 +41,6 @@ class FloatPolarIndexing(Indexing):
         theta %= 360
         x, y = polar_to_cartesian(r, theta)
         x, y = transform_unit_circle_to_origin(x, y, self._origin[0], self._origin[1])
-        # Round to improve caching ability of led spacing
-        x = fast_round(x, 3)
-        y = fast_round(y, 3)
         # get location in light strip
         indx = self._led_spacing.get_closest_LED_index(x, y, self._effect_radius)
         return None if indx is None else self._pixels[indx]
@@ -68,14 +58,9 @@ class FloatPolarIndexing(Indexing):
         if len(key) == 3:
             x, y, r = key
 
-            # Round to improve caching ability of led spacing
-            x = fast_round(x, 3)
-            y = fast_round(y, 3)
-            r = fast_round(r, 3)
-
             leds = self._led_spacing.get_LEDs_in_radius(x, y, r)
-            for l in leds:
-                self._pixels[l._index] = newvalue
+            for i in leds.tolist():
+                self._pixels[i] = newvalue
         else:
             r, theta = key
             theta %= 360
@@ -84,13 +69,9 @@ class FloatPolarIndexing(Indexing):
                 x, y, self._origin[0], self._origin[1]
             )
 
-            # Round to improve caching ability of led spacing
-            x = fast_round(x, 3)
-            y = fast_round(y, 3)
-
             color_leds_in_area(
                 x, y, self._effect_radius, newvalue, self._led_spacing, self._pixels
             )
 
     def prepare_to_send(self):
-        self._led_spacing.save_quadtree_values_in_list()
+        pass
@@ -27,7 +27,5 @@ class Indexing:
     def prepare_to_send(self):
         """Function called to prepare indexing objects to be pickled if they are using objects that
         do not handle pickling well.
-
-        One primary example is the quadtree object
         """
         raise NotImplementedError("'Indexing' class is abstract and should not be used")
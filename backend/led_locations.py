@@ -7,33 +7,7 @@ Estimate the location of LEDs in 2D space based on how they are arranged
 import numpy as np
 from functools import lru_cache
 from typing import List, Optional, Tuple
-from smartquadtree import Quadtree
-from numba import jit
-
-from backend.util import distance_formula
-from backend.mru_cache import mru_cache
-
-
-class LED:
-    def __init__(self, x: float, y: float, index: int):
-        self._x = x
-        self._y = y
-        self._index = index
-
-    def get_x(self) -> float:
-        return self._x
-
-    def get_y(self) -> float:
-        return self._y
-
-    def as_tuple(self) -> Tuple[float, float, int]:
-        return (self._x, self._y, self._index)
-
-    def __str__(self) -> str:
-        return "LED(x: %s, y: %s, index: %s)" % (self._x, self._y, self._index)
-
-    def __repr__(self) -> str:
-        return "LED(x: %s, y: %s, index: %s)" % (self._x, self._y, self._index)
+from numpy._typing import NDArray
 
 
 class LEDSpace:
@@ -42,12 +16,15 @@ class LEDSpace:
     nearest LED for that location.
 
     The 2D space is a 1x1 square, with x going from (0..1) and y going from (0..1)
+
+    LED locations are stored as parallel arrays (`_xs[i]`, `_ys[i]` is the location of the LED at
+    `_idx[i]`) so queries are done with vectorized numpy operations over every LED at once.
     """
 
     def __init__(self) -> None:
-        self._quadtree = Quadtree(0.5, 0.5, 1, 1)
-        # pickling
-        self._saved_values: Optional[List[LED]] = None
+        self._xs: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self._ys: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self._idx: NDArray[np.int32] = np.zeros(0, dtype=np.int32)
 
     def map_LEDs_in_zigzag(self, lights_per_row: List[int]) -> None:
         """
@@ -69,75 +46,53 @@ class LEDSpace:
         Each row moves diagonally upwards towards the next row. We map LEDs using the assumption
         that they are equally spaced.
         """
-        self._quadtree = Quadtree(0.5, 0.5, 1, 1)
-        index = 0
-
         if len(lights_per_row) == 1:
             row_height = 1
         else:
             row_height = 1 / len(lights_per_row)
 
-        for i in range(len(lights_per_row)):
-            for j in range(lights_per_row[i]):
-                if i % 2 == 0:  # backward diagonal
-                    x = 1 - ((j + 1) / lights_per_row[i])
-                    y = (i * row_height) + ((j / lights_per_row[i]) * row_height)
-                else:  # forward diagonal
-                    x = j / lights_per_row[i]
-                    y = (i * row_height) + ((j / lights_per_row[i]) * row_height)
-                led = LED(x, y, index)
-                self._quadtree.insert(led)
-                index += 1
-
-    @lru_cache(maxsize=1000)
-    # @mru_cache(maxsize=1000)
+        # row, column, and length of the row, for every LED in the strip
+        row_ids = np.repeat(np.arange(len(lights_per_row)), lights_per_row)
+        col_ids = np.concatenate([np.arange(n) for n in lights_per_row])
+        row_counts = np.repeat(lights_per_row, lights_per_row)
+
+        frac = col_ids / row_counts
+        # even rows are backward diagonals, odd rows are forward diagonals
+        xs = np.where(row_ids % 2 == 0, 1 - ((col_ids + 1) / row_counts), frac)
+        ys = (row_ids * row_height) + (frac * row_height)
+
+        self._xs = xs.astype(np.float32)
+        self._ys = ys.astype(np.float32)
+        self._idx = np.arange(len(xs), dtype=np.int32)
+
     def get_LEDs_in_area(
         self, x: float, y: float, width: float, height: float
-    ) -> List[LED]:
+    ) -> NDArray[np.int32]:
         """
+        Returns indices of the LEDs in the box
         `width`: width of box centered on `(x, y)`
         `height`: height of box centered on `(x, y)`
         """
-
         left = x - (width / 2)
         right = x + (width / 2)
         bot = y - (height / 2)
         top = y + (height / 2)
 
-        if self._quadtree is None:
-            self.restore_quadtree()
-
-        self._quadtree.set_mask([(left, bot), (left, top), (right, top), (right, bot)])
-
-        res: List[LED] = []
-        for led in self._quadtree.elements():
-            res += [led]
-
-        self._quadtree.set_mask(None)
-
-        return res
+        mask = np.logical_and(
+            np.logical_and(self._xs >= left, self._xs <= right),
+            np.logical_and(self._ys >= bot, self._ys <= top),
+        )
+        return self._idx[mask]
 
-    @lru_cache(maxsize=1000)
-    # @mru_cache(maxsize=1000)
-    def get_LEDs_in_radius(self, x: float, y: float, radius: float) -> List[LED]:
+    def get_LEDs_in_radius(self, x: float, y: float, radius: float) -> NDArray[np.int32]:
         """
-        `radius` around (x, y) of points should be returned
+        Returns indices of the LEDs within `radius` around (x, y)
         """
-        if self._quadtree is None:
-            self.restore_quadtree()
+        dx = self._xs - x
+        dy = self._ys - y
+        mask = dx * dx + dy * dy <= radius * radius
+        return self._idx[mask]
 
-        self._quadtree.set_mask(_mask_for_radius(x, y, radius, 10))
-
-        res: List[LED] = []
-        for led in self._quadtree.elements():
-            res += [led]
-
-        self._quadtree.set_mask(None)
-
-        return res
-
-    @lru_cache(maxsize=1000)
-    # @mru_cache(maxsize=1000)
     def get_closest_LED_index(
         self, x: float, y: float, max_distance: float = 0.30
     ) -> Optional[int]:
@@ -145,66 +100,39 @@ class LEDSpace:
         `max_distance` is the largest distance a point will be returned from the queried point querying for specific
         location in 2D space
         """
-        results = self.get_LEDs_in_area(x, y, max_distance * 2, max_distance * 2)
-
-        closest: Optional[LED] = None
-        closest_distance = 9999999
-        for led in results:
-            distance = distance_formula(x, y, led.get_x(), led.get_y())
-            if distance > max_distance:
-                continue
-            if closest is None or distance < closest_distance:
-                closest = led
-                closest_distance = distance
-
-        return None if closest is None else closest._index
-
-    def save_quadtree_values_in_list(self) -> None:
-        """Save all the values in the quadtree to a python list
-        Quadtree cannot be pickled, so this function allows this object to be pickled by unsetting
-        the quadtree temoproraily and restoring it when used
-        """
-        if self._quadtree is None and self._saved_values is not None:
-            # already saved values, and did not restore
-            return
-
-        self._quadtree.set_mask(None)
-        self._saved_values = []
-        for led in self._quadtree.elements():
-            self._saved_values += [led]
-        self._quadtree = None
-
-    def restore_quadtree(self) -> None:
-        """Restores the quadtree from saved values in `self._saved_values`."""
-        if self._saved_values is None:
-            return
-        self._quadtree = Quadtree(0.5, 0.5, 1, 1)
-        for v in self._saved_values:
-            self._quadtree.insert(v)
-        self._saved_values = None
-
-    def clear_caches(self) -> None:
+        if len(self._idx) == 0:
+            return None
+
+        dx = self._xs - x
+        dy = self._ys - y
+        distances = dx * dx + dy * dy
+        closest = int(np.argmin(distances))
+
+        # written as `not <=` so a NaN query point finds nothing
+        if not distances[closest] <= max_distance * max_distance:
+            return None
+        return int(self._idx[closest])
+
+    def get_LEDs_and_distances_in_radius(
+        self, x: float, y: float, radius: float
+    ) -> Tuple[NDArray[np.int32], NDArray[np.float32]]:
         """
-        Clear cached values
+        Returns indices of the LEDs within `radius` around (x, y), and each of their distances
+        from (x, y)
         """
-        LEDSpace.get_LEDs_in_area.cache_clear()
-        LEDSpace.get_closest_LED_index.cache_clear()
-        LEDSpace.get_LEDs_in_radius.cache_clear()
-
-
-@jit(nopython=True, fastmath=True)
-def _mask_for_radius(
-    x: float, y: float, radius: float, number_points: int
-) -> List[Tuple[float, float]]:
-    """Helper to create the set of points needed to make a mask for the quadtree
-    enacpsulating a circular area"""
-    points: List[Tuple[float, float]] = [(0.0, 0.0)] * number_points
-    i = 0
-    for theta in np.arange(0, 2 * np.pi, (2 * np.pi) / number_points):
-        _x = np.cos(theta) * radius
-        _y = np.sin(theta) * radius
-        _x += x
-        _y += y
-        points[i] = (_x, _y)
-        i += 1
-    return points
+        dx = self._xs - x
+        dy = self._ys - y
+        distances_squared = dx * dx + dy * dy
+        mask = distances_squared <= radius * radius
+        return self._idx[mask], np.sqrt(distances_squared[mask])
+
+
+@lru_cache(maxsize=8)
+def build_led_space(lights_per_row: Tuple[int, ...]) -> LEDSpace:
+    """Returns an `LEDSpace` with LEDs mapped in a zigzag using `lights_per_row`.
+    Spaces are shared between everything asking for the same row arrangement, so only build it
+    once per process"""
+    led_space = LEDSpace()
+    led_space.map_LEDs_in_zigzag(list(lights_per_row))
+    return led_space
+
@@ -6,8 +6,9 @@ try:
 except:
     print("running not on a rasberry pi")
 
+import numpy as np
 from microcontroller import Pin
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Sequence, Tuple
 
 from backend.test_display import TestDisplay
 from backend.backend_types import RGB
@@ -44,7 +45,9 @@ class PixelWrapper:
         if self._pixels:
             return self._pixels.__getitem__(key)
         else:
-            return self._pretend_pixels[key]
+            if type(key) is slice:
+                return [_unpack(p) for p in self._pretend_pixels[key].tolist()]
+            return _unpack(int(self._pretend_pixels[key]))
 
     def __setitem__(self, key: Any, value: RGB) -> None:
         if self._pixels:
@@ -54,7 +57,37 @@ class PixelWrapper:
             for x in value:
                 assert x >= 0
                 assert x < 256
-            self._pretend_pixels[key] = value
+            self._pretend_pixels[key] = _pack(value)
+
+        if self._test_display and self._auto_write:
+            self._test_display.show()
+
+    def set_range(self, start: int, colors: Sequence[RGB]) -> None:
+        """Set consecutive pixels starting at `start` to `colors`. Wraps around to the start of the
+        light strip if it runs past the end. Cannot set more colors than there are pixels"""
+        number_pixels = len(self)
+        assert len(colors) <= number_pixels
+        if len(colors) == 0:
+            return
+        start %= number_pixels
+        end = start + len(colors)
+        split = min(end, number_pixels) - start
+
+        if self._pixels:
+            # slice assignment hands the whole range to neopixel in one call
+            colors = np.asarray(colors).tolist()
+            self._pixels[start : start + split] = colors[:split]
+            if end > number_pixels:
+                self._pixels[: end - number_pixels] = colors[split:]
+        else:
+            colors = np.asarray(colors)
+            assert colors.min() >= 0
+            assert colors.max() < 256
+            colors = colors.astype(np.uint32)
+            packed = (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+            self._pretend_pixels[start : start + split] = packed[:split]
+            if end > number_pixels:
+                self._pretend_pixels[: end - number_pixels] = packed[split:]
 
         if self._test_display and self._auto_write:
             self._test_display.show()
@@ -62,20 +95,19 @@ class PixelWrapper:
     def __len__(self) -> int:
         if self._pixels:
             return len(self._pixels)
-        elif self._pretend_pixels:
+        elif self._pretend_pixels is not None:
             return len(self._pretend_pixels)
         else:
             return 0
 
     def fill(self, color: RGB) -> None:
         if self._pixels:
+            # neopixel already updates the lights itself when `auto_write` is on
             self._pixels.fill(color)
-        elif self._pretend_pixels:
-            for i in range(len(self._pretend_pixels)):
-                self._pretend_pixels[i] = color
-
-        if self._auto_write:
-            self.show()
+        elif self._pretend_pixels is not None:
+            self._pretend_pixels[:] = _pack(color)
+            if self._auto_write:
+                self.show()
 
     def show(self):
         if self._test_display and self.print_to_stdout:
@@ -84,6 +116,16 @@ class PixelWrapper:
             self._pixels.show()
 
 
+def _pack(color: RGB) -> int:
+    """Pack an rgb color into a single 0xRRGGBB integer"""
+    return (int(color[0]) << 16) | (int(color[1]) << 8) | int(color[2])
+
+
+def _unpack(packed: int) -> Tuple[int, int, int]:
+    """Unpack a 0xRRGGBB integer into an rgb color"""
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
 def init_with_real_board(
     io_pin: Optional[Pin], number_lights: int, auto_write: bool
 ) -> PixelWrapper:
@@ -100,7 +142,7 @@ def init_with_real_board(
 
 def init_for_testing(number_leds: int, print_to_stdout: bool = True) -> PixelWrapper:
     pixel = PixelWrapper()
-    pixel._pretend_pixels = [(0, 0, 0)] * number_leds
+    pixel._pretend_pixels = np.zeros(number_leds, dtype=np.uint32)
     pixel._auto_write = False
     pixel.print_to_stdout = print_to_stdout
     return pixel
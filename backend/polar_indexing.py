@@ -5,9 +5,8 @@ from backend.indexing import Indexing
 
 from backend.neopixel_wrapper import PixelWrapper
 from backend.backend_types import RGB
-from backend.led_locations import LEDSpace
+from backend.led_locations import build_led_space
 from backend.util import (
-    fast_round,
     polar_to_cartesian,
     transform_unit_circle_to_origin,
 )
@@ -25,19 +24,13 @@ class PolarIndexing(Indexing):
         lights_per_row: List[int],
         origin: Tuple[float, float] = (0.5, 0.5),
         search_range: float = 0.2,
-        cached_led_spacing: Optional[LEDSpace] = None,
     ):
         self._pixels = pixels
         self._origin = origin
         self._lights_per_row = lights_per_row
         self._search_range = search_range
 
-        if cached_led_spacing:
-            self._led_spacing = cached_led_spacing
-            self._led_spacing.clear_caches()
-        else:
-            self._led_spacing = LEDSpace()
-            self._led_spacing.map_LEDs_in_zigzag(lights_per_row)
+        self._led_spacing = build_led_space(tuple(lights_per_row))
 
     def get(self, key: Tuple[float, float]) -> Optional[RGB]:
         """
@@ -48,10 +41,6 @@ class PolarIndexing(Indexing):
         x, y = polar_to_cartesian(r, theta)
         x, y = transform_unit_circle_to_origin(x, y, self._origin[0], self._origin[1])
 
-        # Round to improve caching ability of led spacing
-        x = fast_round(x, 3)
-        y = fast_round(y, 3)
-
         # get location in light strip
         indx = self._led_spacing.get_closest_LED_index(x, y, self._search_range)
         return None if indx is None else self._pixels[indx]
@@ -68,14 +57,9 @@ class PolarIndexing(Indexing):
         if len(key) == 3:
             x, y, r = key
 
-            # Round to improve caching ability of led spacing
-            x = fast_round(x, 2)
-            y = fast_round(y, 2)
-            r = fast_round(r, 2)
-
             leds = self._led_spacing.get_LEDs_in_radius(x, y, r)
-            for l in leds:
-                self._pixels[l._index] = newvalue
+            for i in leds.tolist():
+                self._pixels[i] = newvalue
         else:
             r, theta = key
             theta %= 360
@@ -84,13 +68,9 @@ class PolarIndexing(Indexing):
                 x, y, self._origin[0], self._origin[1]
             )
 
-            # Round to improve caching ability of led spacing
-            x = fast_round(x, 3)
-            y = fast_round(y, 3)
-
             indx = self._led_spacing.get_closest_LED_index(x, y, self._search_range)
             if indx is not None:
                 self._pixels[indx] = newvalue
 
     def prepare_to_send(self):
-        self._led_spacing.save_quadtree_values_in_list()
+        pass
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from itertools import accumulate
 from typing import Union, Tuple, Optional, List
 from backend.indexing import Indexing
 
@@ -16,6 +17,8 @@ class RowIndexing(Indexing):
     def __init__(self, pixels: PixelWrapper, lights_per_row: List[int]):
         self._pixels = pixels
         self.rows = lights_per_row
+        # index in the light strip where each row starts
+        self._row_starts: List[int] = list(accumulate([0] + lights_per_row))[:-1]
 
     def get(self, key: Tuple[int, int]) -> Optional[RGB]:
         """key: (row, col)"""
@@ -33,15 +36,22 @@ class RowIndexing(Indexing):
             self._pixels[self.row_col_to_indx(row, col)] = newvalue
         elif type(key) is int:
             row = key
-            for i in range(self.rows[row]):
-                self._pixels[self.row_col_to_indx(row, i)] = newvalue
+            # every LED in a row is contiguous in the light strip, so set them in one write
+            first = min(
+                self.row_col_to_indx(row, 0),
+                self.row_col_to_indx(row, self.rows[row] - 1),
+            )
+            # set_range would wrap around the end of the strip, so fail like a bad index instead
+            if first + self.rows[row] > len(self._pixels):
+                raise IndexError("row %s runs past the end of the light strip" % row)
+            self._pixels.set_range(first, [newvalue] * self.rows[row])
         else:
             raise NotImplementedError("key for row indexing was neither tuple or int")
 
     def row_col_to_indx(self, row: int, col: int) -> int:
         """Convert row and col position to index in light strip"""
         row = row % len(self.rows)
-        indx = sum(self.rows[:row])
+        indx = self._row_starts[row]
         if row % 2 == 0:
             indx += col
         else:
@@ -28,27 +28,21 @@ def color_leds_in_area(
 ):
     """Colors LEDs within `effect_radius` with `color`. Has an airbrush effect where it will merge
     `color` with the color already there"""
-    leds = led_spacing.get_LEDs_in_radius(x, y, effect_radius)
+    leds, distances = led_spacing.get_LEDs_and_distances_in_radius(x, y, effect_radius)
 
-    for l in leds:
+    for i, dist in zip(leds.tolist(), distances.tolist()):
         # NOTE: we ignore the type warning/error on pixels as checking types here is pretty slow
         # since this is a very hot section of code
-        pixels[l._index] = _area_lerp_color(
-            l._x, l._y, x, y, effect_radius, pixels[l._index], color
-        )
+        pixels[i] = _area_lerp_color(dist, effect_radius, pixels[i], color)
 
 
 @jit(nopython=True, fastmath=True, cache=True)
 def _area_lerp_color(
-    led_x: float,
-    led_y: float,
-    x: float,
-    y: float,
+    dist: float,
     effect_radius: float,
     cur_color: RGB,
     set_color: RGB,
 ) -> RGB:
-    dist = distance_formula(led_x, led_y, x, y)
     amp = max(0, 1 - (dist / effect_radius))
 
     res = dim_color_by_amount_fast(set_color, amp)
@@ -162,6 +156,19 @@ def color_range(
     return [color_obj_to_rgb(c) for c in colors_spanning]
 
 
+def color_gradient(
+    color_start: Union[RGB, str, colour.Color],
+    color_end: Union[RGB, str, colour.Color],
+    number: int,
+) -> NDArray[np.uint8]:
+    """Returns `number` colors spanning the range from `color_start` to `color_end` as a
+    (`number`, 3) array. Interpolates each rgb channel linearly, so can be built once and written
+    with `Ceiling.set_range` without converting each color"""
+    rgb_start = np.array(color_format_to_rgb(color_start), dtype=np.float64)
+    rgb_end = np.array(color_format_to_rgb(color_end), dtype=np.float64)
+    return np.rint(np.linspace(rgb_start, rgb_end, number)).astype(np.uint8)
+
+
 def colour_rgb_to_neopixel_rgb(rgb: Tuple[float, float, float]) -> RGB:
     """Convert the colour library's `rgb` which has componenets from 0..1 to neopixel's rgb which
     is 0..255"""
@@ -191,11 +198,6 @@ def sigmoid_0_to_1(x: float) -> float:
     return sigmoid(sigmoid_input)
 
 
-@jit(fastmath=True, cache=True)
-def distance_formula(x1: float, y1: float, x2: float, y2: float):
-    return np.sqrt(np.power(x2 - x1, 2) + np.power(y2 - y1, 2))
-
-
 @jit(fastmath=True, cache=True)
 def polar_to_cartesian(r: float, theta: float) -> Tuple[float, float]:
     theta = np.radians(theta)
@@ -235,9 +237,3 @@ def rotate_vector(vector: NDArray[np.float64], theta: float) -> NDArray[np.float
     y_comp = (vector_0 * rot_mat[1, 0]) + (vector_1 * rot_mat[1, 1])
     return np.array([x_comp, y_comp])
     # return np.dot(vector, rot_mat)
-
-
-@jit(fastmath=True, cache=True)
-def fast_round(number: float, decimals: int) -> float:
-    """Rounds `number` to `decimals` decimal points"""
-    return np.around(number, decimals)
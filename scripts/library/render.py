@@ -39,26 +39,24 @@ class RenderState(ABC):
         will continue running in a loop
         """
         run = True
-        ns_per_frame = 1000000000 / fps
-        last_frame_time = time.time_ns()
-        delta = 0
+        frame_time = 1 / fps
+        next_frame = time.monotonic()
 
         while run is True or run is None:
-            start_time = time.time_ns()
-            delta += (start_time - last_frame_time) / ns_per_frame
-            last_frame_time = start_time
-
-            if delta >= 1:
-                run = self.render(1 / fps, ceil)
-
-                if self.interval is not None:
-                    self._cur += 1 / fps
-                    if self._cur > self.interval:
-                        self._cur = 0
-                        self.interval_reached(ceil)
-
-                delta -= 1
-
+            run = self.render(frame_time, ceil)
+
+            if self.interval is not None:
+                self._cur += frame_time
+                if self._cur > self.interval:
+                    self._cur = 0
+                    self.interval_reached(ceil)
+
+            # Schedule frames against the clock so time spent rendering does not slow the
+            # animation, and sleep until the next frame instead of spinning
+            next_frame += frame_time
+            remaining = next_frame - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
 
     def progress(self) -> float:
         """Returns percetnage progress towards `_interval` (always 0..1)"""
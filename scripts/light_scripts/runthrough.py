@@ -5,26 +5,35 @@
 
 import sys
 import time
+import numpy as np
 from typing import Optional, Union
 from backend.backend_types import RGB
 
 from backend.ceiling import Ceiling
-from backend.util import color_format_to_rgb, color_range, dim_color
+from backend.util import color_format_to_rgb, color_gradient, dim_color
 from scripts.library.render import RenderState
 
 
 class Render(RenderState):
     def __init__(self, color: RGB, interval: Optional[float]):
         self.TAIL_LENGTH = 7
-        self.colors = color_range(color, dim_color(color), self.TAIL_LENGTH)
+        # ordered tail to head, so the whole tail can be written in one `set_range`
+        self.colors = color_gradient(dim_color(color), color, self.TAIL_LENGTH)
+        self.blank = np.zeros_like(self.colors)
+        self.prev_index: Optional[int] = None
         super().__init__(interval * 3)
 
     def render(self, delta: float, ceil: Ceiling) -> Union[bool, None]:
         index = int(self.progress() * ceil.NUMBER_LIGHTS)
 
-        ceil.clear(False)
-        for i in range(0, self.TAIL_LENGTH):
-            ceil[index - i] = self.colors[i]
+        if self.prev_index is not None:
+            # only blank the pixels that fell off the end of the tail since last frame
+            moved = min((index - self.prev_index) % ceil.NUMBER_LIGHTS, self.TAIL_LENGTH)
+            if moved > 0:
+                ceil.set_range(self.prev_index - self.TAIL_LENGTH + 1, self.blank[:moved])
+        self.prev_index = index
+
+        ceil.set_range(index - self.TAIL_LENGTH + 1, self.colors)
 
         ceil.show()
 
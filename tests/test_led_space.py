@@ -1,15 +1,117 @@
 #!/usr/bin/env python3
 
-# from ..src.backend.led_locations import LEDSpace
-# from byronsbasement import *
-from src.backend.led_locations import LEDSpace
 import numpy as np
-from src.backend.ceiling import Ceiling
-
-## from byronsbasement.backend.led_locations import LEDSpace
 import pytest
 
+from backend.led_locations import LEDSpace
+
+CEILING_ROW_ARRANGEMENT = [29, 29, 32, 29, 32, 28, 20]
+
+
+def _expected_positions(lights_per_row):
+    """LED positions from the original per-LED zigzag formula"""
+    xs = []
+    ys = []
+    row_height = 1 if len(lights_per_row) == 1 else 1 / len(lights_per_row)
+    for i in range(len(lights_per_row)):
+        for j in range(lights_per_row[i]):
+            if i % 2 == 0:  # backward diagonal
+                x = 1 - ((j + 1) / lights_per_row[i])
+            else:  # forward diagonal
+                x = j / lights_per_row[i]
+            y = (i * row_height) + ((j / lights_per_row[i]) * row_height)
+            xs += [x]
+            ys += [y]
+    return np.array(xs), np.array(ys)
+
+
+@pytest.fixture
+def led_space():
+    led_space = LEDSpace()
+    led_space.map_LEDs_in_zigzag(CEILING_ROW_ARRANGEMENT)
+    return led_space
+
+
+def test_led_space_simple_zigzag(led_space):
+    xs, ys = _expected_positions(CEILING_ROW_ARRANGEMENT)
+    assert np.allclose(led_space._xs, xs)
+    assert np.allclose(led_space._ys, ys)
+    assert led_space._idx.tolist() == list(range(sum(CEILING_ROW_ARRANGEMENT)))
+
+
+def test_led_space_single_row():
+    led_space = LEDSpace()
+    led_space.map_LEDs_in_zigzag([5])
+    xs, ys = _expected_positions([5])
+    assert np.allclose(led_space._xs, xs)
+    assert np.allclose(led_space._ys, ys)
+
+
+def test_get_LEDs_in_area(led_space):
+    xs, ys = _expected_positions(CEILING_ROW_ARRANGEMENT)
+    rng = np.random.default_rng(0)
+    for x, y, width, height in zip(
+        rng.uniform(-0.1, 1.1, 500),
+        rng.uniform(-0.1, 1.1, 500),
+        rng.uniform(0, 0.4, 500),
+        rng.uniform(0, 0.4, 500),
+    ):
+        in_area = (
+            (xs >= x - width / 2)
+            & (xs <= x + width / 2)
+            & (ys >= y - height / 2)
+            & (ys <= y + height / 2)
+        )
+        expected = np.nonzero(in_area)[0].tolist()
+        assert led_space.get_LEDs_in_area(x, y, width, height).tolist() == expected
+
+
+def test_get_LEDs_in_radius(led_space):
+    xs, ys = _expected_positions(CEILING_ROW_ARRANGEMENT)
+    rng = np.random.default_rng(1)
+    for x, y, radius in zip(
+        rng.uniform(-0.1, 1.1, 500),
+        rng.uniform(-0.1, 1.1, 500),
+        rng.uniform(0, 0.3, 500),
+    ):
+        distances = np.hypot(xs - x, ys - y)
+        expected = np.nonzero(distances <= radius)[0].tolist()
+        assert led_space.get_LEDs_in_radius(x, y, radius).tolist() == expected
+
+
+def test_get_LEDs_in_radius_small_radius(led_space):
+    x, y = float(led_space._xs[50]), float(led_space._ys[50])
+    assert led_space.get_LEDs_in_radius(x, y, 0.001).tolist() == [50]
+
+
+def test_get_LEDs_nan(led_space):
+    assert led_space.get_LEDs_in_area(np.nan, 0.5, 0.2, 0.2).tolist() == []
+    assert led_space.get_LEDs_in_radius(0.5, np.nan, 0.1).tolist() == []
+    assert led_space.get_LEDs_in_radius(0.5, 0.5, np.inf).tolist() == list(
+        range(sum(CEILING_ROW_ARRANGEMENT))
+    )
+
+
+def test_get_LEDs_and_distances_in_radius(led_space):
+    xs, ys = _expected_positions(CEILING_ROW_ARRANGEMENT)
+    x, y, radius = 0.4321, 0.5678, 0.15
+    leds, distances = led_space.get_LEDs_and_distances_in_radius(x, y, radius)
+    expected_distances = np.hypot(xs - x, ys - y)
+    assert leds.tolist() == np.nonzero(expected_distances <= radius)[0].tolist()
+    assert np.allclose(distances, expected_distances[leds], atol=1e-6)
+
+
+def test_get_closest_LED_index(led_space):
+    xs, ys = _expected_positions(CEILING_ROW_ARRANGEMENT)
+    rng = np.random.default_rng(2)
+    max_distance = 0.05
+    for x, y in zip(rng.uniform(-0.1, 1.1, 500), rng.uniform(-0.1, 1.1, 500)):
+        distances = np.hypot(xs - x, ys - y)
+        closest = int(np.argmin(distances))
+        expected = closest if distances[closest] <= max_distance else None
+        assert led_space.get_closest_LED_index(x, y, max_distance) == expected
 
-def test_led_space_simple_zigzag():
-    print("hij")
-    # led_space = LEDSpace()
+    # a NaN query finds nothing rather than falling back to the first LED
+    assert led_space.get_closest_LED_index(np.nan, 0.5, 0.1) is None
+    assert led_space.get_closest_LED_index(np.nan, np.nan, 0.1) is None
+    assert led_space.get_closest_LED_index(0.5, 0.5, np.nan) is None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+from backend.ceiling import Ceiling
+from backend.neopixel_wrapper import _pack, _unpack, init_for_testing
+from scripts.light_scripts.runthrough import Render
+
+NUMBER_LIGHTS = 200
+
+
+@pytest.fixture
+def pixels():
+    return init_for_testing(NUMBER_LIGHTS, print_to_stdout=False)
+
+
+def _lit(pixels):
+    return [i for i, color in enumerate(pixels[:]) if color != (0, 0, 0)]
+
+
+def test_pack_unpack_round_trip():
+    for color in [(0, 0, 0), (255, 255, 255), (1, 2, 3), (255, 0, 128)]:
+        assert _unpack(_pack(color)) == color
+    assert _pack((0x12, 0x34, 0x56)) == 0x123456
+
+
+def test_set_and_get_pixel(pixels):
+    pixels[5] = (10, 20, 30)
+    pixels[-1] = np.array([255, 0, 1])
+    assert pixels[5] == (10, 20, 30)
+    assert pixels[NUMBER_LIGHTS - 1] == (255, 0, 1)
+    assert pixels[4] == (0, 0, 0)
+
+
+def test_fill(pixels):
+    pixels.fill((7, 8, 9))
+    assert pixels[:] == [(7, 8, 9)] * NUMBER_LIGHTS
+
+
+def test_set_range(pixels):
+    pixels.set_range(10, [(1, 1, 1), (2, 2, 2)])
+    assert pixels[10] == (1, 1, 1)
+    assert pixels[11] == (2, 2, 2)
+    assert _lit(pixels) == [10, 11]
+
+
+def test_set_range_wraps_around(pixels):
+    colors = np.array([(1, 1, 1), (2, 2, 2), (3, 3, 3), (4, 4, 4)], dtype=np.uint8)
+    pixels.set_range(198, colors)
+    assert _lit(pixels) == [0, 1, 198, 199]
+    assert [pixels[i] for i in (198, 199, 0, 1)] == [
+        (1, 1, 1),
+        (2, 2, 2),
+        (3, 3, 3),
+        (4, 4, 4),
+    ]
+
+
+def test_set_range_negative_start(pixels):
+    pixels.set_range(-1, [(1, 1, 1), (2, 2, 2)])
+    assert pixels[NUMBER_LIGHTS - 1] == (1, 1, 1)
+    assert pixels[0] == (2, 2, 2)
+    assert _lit(pixels) == [0, NUMBER_LIGHTS - 1]
+
+
+def test_set_range_empty(pixels):
+    pixels.set_range(0, [])
+    assert _lit(pixels) == []
+
+
+def test_set_range_too_many_colors(pixels):
+    with pytest.raises(AssertionError):
+        pixels.set_range(0, [(1, 1, 1)] * (NUMBER_LIGHTS + 1))
+
+
+def test_runthrough_only_tail_is_lit():
+    ceil = Ceiling(test_mode=True, print_to_stdout=False)
+    ceil.use_linear()
+    render = Render((255, 0, 0), 1)
+
+    def render_at(index):
+        render._cur = (index / ceil.NUMBER_LIGHTS) * render.interval
+        render.render(1 / 30, ceil)
+        return int(render.progress() * ceil.NUMBER_LIGHTS)
+
+    for index in [10, 11, 14, 30]:
+        head = render_at(index)
+        lit = list(range(head - render.TAIL_LENGTH + 1, head + 1))
+        assert _lit(ceil._pixels) == lit
+
+    # wrapping back to the start of the strip blanks the old tail at the end
+    head = render_at(2)
+    lit = [i % ceil.NUMBER_LIGHTS for i in range(head - render.TAIL_LENGTH + 1, head + 1)]
+    assert _lit(ceil._pixels) == sorted(lit)